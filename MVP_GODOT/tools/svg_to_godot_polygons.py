@@ -18,18 +18,216 @@ Date: 2024
 """
 
 import json
+import mmap
 import re
 import sys
+from functools import partial
 from pathlib import Path
-from typing import List, Tuple, Dict
-import xml.etree.ElementTree as ET
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    # lxml is optional - its C parser is faster when available
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+try:
+    # orjson is optional - a much faster JSON encoder when available
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Bump whenever a change can alter the converted output (parsing, simplification,
+# centroid or rounding - even last-digit float differences such as moving the
+# centroid to mean() + np.round) so stale cache entries are ignored
+_CACHE_VERSION = 2
+
+# <path> tags in Clark notation: SVG-namespaced, and bare (no namespace)
+_SVG_PATH_TAG = '{http://www.w3.org/2000/svg}path'
+_BARE_PATH_TAG = 'path'
+
+# Numeric tokens in SVG path data (signs and exponents included)
+_NUM_RE = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+_NUM_RE_BYTES = re.compile(_NUM_RE.pattern.encode('ascii'))
+
+# Raw `d="..."` payloads of <path> tags, for the regex fast path over file bytes
+_D_ATTR_RE = re.compile(rb'<path\b[^>]*?\sd\s*=\s*"([^"]*)"')
+_PATH_TAG_RE = re.compile(rb'<path\b')
+_PREFIXED_PATH_TAG_RE = re.compile(rb'<[\w.-]+:path\b')
+
+# Constructs the fast path cannot interpret like an XML parser would
+_FAST_PATH_UNSAFE = (b'<!--', b'<![CDATA[', b"d='", b'&')
+
+
+def _rdp_core(xs: np.ndarray, ys: np.ndarray, eps2: float) -> np.ndarray:
+    """
+    Scalar Ramer-Douglas-Peucker loop, compiled with numba when installed.
+    
+    Compares the squared cross product against eps2 * |Pn - P1|^2 so neither
+    a sqrt nor a per-point division is needed, and uses a preallocated
+    (lo, hi) stack that never holds more than N intervals.
+    
+    Args:
+        xs: float64 array of x coordinates
+        ys: float64 array of y coordinates
+        eps2: Squared tolerance
+        
+    Returns:
+        Boolean keep mask of length N
+    """
+    n = xs.shape[0]
+    keep = np.zeros(n, dtype=np.bool_)
+    keep[0] = True
+    keep[n - 1] = True
+    stack = np.empty((n, 2), dtype=np.int32)
+    stack[0, 0] = 0
+    stack[0, 1] = n - 1
+    top = 1
+    
+    while top > 0:
+        top -= 1
+        lo = stack[top, 0]
+        hi = stack[top, 1]
+        if hi - lo < 2:
+            continue
+        
+        dx = xs[hi] - xs[lo]
+        dy = ys[hi] - ys[lo]
+        len2 = dx * dx + dy * dy
+        # Degenerate segments fall back to plain distance from the endpoint
+        threshold = eps2 if len2 == 0.0 else eps2 * len2
+        
+        best = -1.0
+        mid = -1
+        for k in range(lo + 1, hi):
+            wx = xs[k] - xs[lo]
+            wy = ys[k] - ys[lo]
+            if len2 == 0.0:
+                d2 = wx * wx + wy * wy
+            else:
+                cross = dx * wy - dy * wx
+                d2 = cross * cross
+            if d2 > best:
+                best = d2
+                mid = k
+        
+        if best > threshold:
+            keep[mid] = True
+            stack[top, 0] = lo
+            stack[top, 1] = mid
+            stack[top + 1, 0] = mid
+            stack[top + 1, 1] = hi
+            top += 2
+    
+    return keep
+
+
+# numba is optional and only worth loading for very large polygons: importing
+# it and loading the cached JIT code costs ~0.3s once, while the NumPy path
+# takes ~5us per vertex (territory outlines have a few hundred vertices)
+_NUMBA_MIN_VERTICES = 60_000
+_rdp_core_jit = None
+
+
+def _get_rdp_core_jit():
+    """Import numba and wrap _rdp_core on first use; None if not installed."""
+    global _rdp_core_jit
+    if _rdp_core_jit is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _rdp_core_jit = False
+        else:
+            # cache=True persists the compiled code, so later runs skip compilation
+            _rdp_core_jit = njit(cache=True, fastmath=True)(_rdp_core)
+    return _rdp_core_jit or None
+
+
+def rdp_mask(points: np.ndarray, epsilon: float) -> np.ndarray:
+    """
+    Compute which vertices Ramer-Douglas-Peucker keeps for a polyline.
+    
+    Uses an explicit stack of (lo, hi) intervals and a boolean keep mask
+    instead of recursion, so no intermediate point lists are allocated.
+    
+    Args:
+        points: (N, 2) array of x, y coordinates
+        epsilon: Maximum perpendicular distance a dropped point may have
+                 from the simplified line (in pixels)
+        
+    Returns:
+        Boolean array of length N (endpoints always kept)
+    """
+    n = len(points)
+    if n < 3:
+        return np.ones(n, dtype=bool)
+    
+    rdp_core_jit = _get_rdp_core_jit() if n >= _NUMBA_MIN_VERTICES else None
+    if rdp_core_jit is not None:
+        xs = np.ascontiguousarray(points[:, 0], dtype=np.float64)
+        ys = np.ascontiguousarray(points[:, 1], dtype=np.float64)
+        return rdp_core_jit(xs, ys, float(epsilon) * float(epsilon))
+    
+    eps2 = epsilon * epsilon
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[n - 1] = True
+    stack = [(0, n - 1)]
+    
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo < 2:
+            continue
+        
+        start = points[lo]
+        seg = points[lo + 1:hi] - start
+        dx, dy = points[hi] - start
+        len2 = dx * dx + dy * dy
+        
+        if len2 == 0:
+            # Degenerate segment - fall back to distance from the endpoint
+            d2 = (seg * seg).sum(axis=1)
+            threshold = eps2
+        else:
+            # dist^2 = ((Pn - P1) x (Pk - P1))^2 / |Pn - P1|^2 - compare the
+            # numerator against eps^2 * |Pn - P1|^2 to skip sqrt and division
+            cross = dx * seg[:, 1] - dy * seg[:, 0]
+            d2 = cross * cross
+            threshold = eps2 * len2
+        
+        k = int(d2.argmax())
+        if d2[k] > threshold:
+            mid = lo + 1 + k
+            keep[mid] = True
+            stack.append((lo, mid))
+            stack.append((mid, hi))
+    
+    return keep
+
+
+def rdp(points: np.ndarray, epsilon: float) -> np.ndarray:
+    """
+    Simplify a polyline with the Ramer-Douglas-Peucker algorithm.
+    
+    Args:
+        points: (N, 2) array of x, y coordinates
+        epsilon: Maximum perpendicular distance a dropped point may have
+                 from the simplified line (in pixels)
+        
+    Returns:
+        Simplified (M, 2) array of coordinates (endpoints always kept)
+    """
+    return points[rdp_mask(points, epsilon)]
 
 
 class SVGToGodotConverter:
     """Converts SVG path data to Godot Polygon2D format."""
     
     def __init__(self, source_width=1920, source_height=1080, 
-                 target_width=1920, target_height=1080):
+                 target_width=1920, target_height=1080,
+                 fast_regex_mode=True):
         """
         Initialize the converter with viewport dimensions.
         
@@ -38,15 +236,30 @@ class SVGToGodotConverter:
             source_height: Height of the original SVG viewport
             target_width: Width of the target Godot viewport
             target_height: Height of the target Godot viewport
+            fast_regex_mode: Extract `d` attributes with a byte regex over a
+                             memory-mapped file instead of parsing the XML
         """
         self.source_width = source_width
         self.source_height = source_height
         self.target_width = target_width
         self.target_height = target_height
-        self.scale_x = target_width / source_width
-        self.scale_y = target_height / source_height
+        # Single source of truth for the scale factors, reused per file
+        self._scale = np.array([target_width / source_width,
+                                target_height / source_height])
+        self.fast_regex_mode = fast_regex_mode
+        self._total_vertices = 0  # Running total from the last convert_svg_folder
+    
+    @property
+    def scale_x(self) -> float:
+        """Horizontal scale factor (read-only - derived from the viewports)."""
+        return float(self._scale[0])
     
-    def parse_svg_file(self, file_path: str) -> List[Tuple[float, float]]:
+    @property
+    def scale_y(self) -> float:
+        """Vertical scale factor (read-only - derived from the viewports)."""
+        return float(self._scale[1])
+    
+    def parse_svg_file(self, file_path: str) -> np.ndarray:
         """
         Parse an SVG file and extract path data.
         
@@ -54,41 +267,81 @@ class SVGToGodotConverter:
             file_path: Path to the SVG file
             
         Returns:
-            List of (x, y) coordinate tuples
+            (N, 2) array of x, y coordinates
         """
+        if self.fast_regex_mode:
+            coords = self._parse_svg_file_fast(file_path)
+            if coords is not None:
+                return coords
+        
         try:
-            # Parse the SVG XML
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            
-            # Handle namespace
-            namespace = {'svg': 'http://www.w3.org/2000/svg'}
-            
-            # Find all path elements
-            paths = root.findall('.//svg:path', namespace)
-            if not paths:
-                # Try without namespace
-                paths = root.findall('.//path')
+            # Stream the SVG XML instead of building the full tree
+            # SVG-namespaced paths take precedence; bare <path> elements are
+            # only used when the file has no namespaced ones
+            found = {_SVG_PATH_TAG: False, _BARE_PATH_TAG: False}
+            coordinates = {_SVG_PATH_TAG: [], _BARE_PATH_TAG: []}
+            for _, elem in ET.iterparse(file_path, events=('end',)):
+                tag = elem.tag
+                if tag in found:
+                    found[tag] = True
+                    d = elem.get('d', '')
+                    if d:
+                        coordinates[tag].append(self.parse_svg_path(d))
+                # Release element content once processed to bound memory
+                elem.clear()
             
-            if not paths:
+            if found[_SVG_PATH_TAG]:
+                all_coordinates = coordinates[_SVG_PATH_TAG]
+            elif found[_BARE_PATH_TAG]:
+                all_coordinates = coordinates[_BARE_PATH_TAG]
+            else:
                 print(f"❌ ERROR: No path elements found in {file_path}")
-                return []
-            
-            # Combine all paths (in case there are multiple)
-            all_coordinates = []
-            for path in paths:
-                d = path.get('d', '')
-                if d:
-                    coords = self.parse_svg_path(d)
-                    all_coordinates.extend(coords)
+                return np.empty((0, 2))
             
-            return all_coordinates
+            if not all_coordinates:
+                return np.empty((0, 2))
+            return np.concatenate(all_coordinates)
             
         except Exception as e:
             print(f"❌ ERROR: Failed to parse SVG file {file_path}: {e}")
-            return []
+            return np.empty((0, 2))
     
-    def parse_svg_path(self, path_string: str) -> List[Tuple[float, float]]:
+    def _parse_svg_file_fast(self, file_path: str) -> Optional[np.ndarray]:
+        """
+        Extract path data straight from the file bytes, skipping XML parsing.
+        
+        The territory SVGs share one flat structure, so a byte regex over a
+        memory-mapped file finds every <path> `d` attribute without decoding.
+        Files containing comments, CDATA, single-quoted `d` attributes,
+        entities or namespace-prefixed tags such as <svg:path>, or any <path>
+        the regex could not read, are left to the XML parser, so on every
+        file it accepts the fast path returns the XML parser's geometry.
+        
+        Args:
+            file_path: Path to the SVG file
+            
+        Returns:
+            (N, 2) array of x, y coordinates, or None to fall back to the
+            XML parser (unsafe constructs, unmatched paths or file not mappable)
+        """
+        try:
+            with open(file_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if any(mm.find(marker) != -1 for marker in _FAST_PATH_UNSAFE):
+                    return None
+                if _PREFIXED_PATH_TAG_RE.search(mm):
+                    return None
+                path_data = [m.group(1) for m in _D_ATTR_RE.finditer(mm)]
+                path_count = sum(1 for _ in _PATH_TAG_RE.finditer(mm))
+        except (OSError, ValueError):
+            return None
+        
+        if not path_data or len(path_data) != path_count:
+            return None
+        
+        return np.concatenate([self.parse_svg_path(d) for d in path_data])
+    
+    def parse_svg_path(self, path_string: Union[str, bytes]) -> np.ndarray:
         """
         Parse SVG path commands into coordinate pairs.
         
@@ -97,132 +350,162 @@ class SVGToGodotConverter:
         - L x,y (LineTo)
         - Z (ClosePath - ignored as it just connects to first point)
         
+        Numbers following an M/L command are implicit LineTo pairs, so every
+        numeric token is simply consumed as part of an (x, y) pair.
+        
         Args:
-            path_string: SVG path data string
+            path_string: SVG path data (str, or bytes from the fast path)
             
         Returns:
-            List of (x, y) coordinate tuples
+            (N, 2) array of x, y coordinates
         """
-        coordinates = []
-        
-        # Remove extra whitespace and split by commands
-        path_string = path_string.strip()
+        if isinstance(path_string, bytes):
+            numbers = _NUM_RE_BYTES.findall(path_string)
+        else:
+            numbers = _NUM_RE.findall(path_string)
         
-        # Split the path into tokens (commands and coordinates)
-        tokens = re.findall(r'[MLZ]|[\d.]+', path_string)
+        # Drop a dangling coordinate that has no partner
+        count = len(numbers) - len(numbers) % 2
         
-        i = 0
-        while i < len(tokens):
-            token = tokens[i]
-            
-            if token in ['M', 'L']:
-                # Next two tokens should be x and y coordinates
-                if i + 2 < len(tokens):
-                    try:
-                        x = float(tokens[i + 1])
-                        y = float(tokens[i + 2])
-                        coordinates.append((x, y))
-                        i += 3
-                    except (ValueError, IndexError):
-                        i += 1
-                else:
-                    i += 1
-            elif token == 'Z':
-                # Close path - skip
-                i += 1
-            else:
-                # If we encounter a coordinate without a command,
-                # assume it's a continuation of the last command (LineTo)
-                if i + 1 < len(tokens):
-                    try:
-                        x = float(token)
-                        y = float(tokens[i + 1])
-                        coordinates.append((x, y))
-                        i += 2
-                    except (ValueError, IndexError):
-                        i += 1
-                else:
-                    i += 1
-        
-        return coordinates
-    
-    def scale_coordinates(self, coordinates: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+        # Convert all tokens to floats in one C-level pass
+        return np.array(numbers[:count], dtype=np.float64).reshape(-1, 2)
+    
+    def scale_coordinates(self, coordinates: np.ndarray) -> np.ndarray:
         """
         Scale coordinates from source viewport to target viewport.
         
         Args:
-            coordinates: List of (x, y) coordinate tuples
+            coordinates: (N, 2) array of x, y coordinates
             
         Returns:
-            List of scaled (x, y) coordinate tuples
+            (N, 2) array of scaled coordinates
         """
-        scaled = []
-        for x, y in coordinates:
-            scaled_x = x * self.scale_x
-            scaled_y = y * self.scale_y
-            scaled.append((scaled_x, scaled_y))
-        return scaled
-    
-    def simplify_polygon(self, coordinates: List[Tuple[float, float]], 
-                         tolerance: float = 1.0) -> List[Tuple[float, float]]:
+        # Default config maps 1920x1080 onto itself - nothing to do
+        if self._scale[0] == 1.0 and self._scale[1] == 1.0:
+            return coordinates
+        
+        return coordinates * self._scale
+    
+    def simplify_polygon(self, coordinates: np.ndarray, 
+                         tolerance: float = 1.0) -> np.ndarray:
         """
-        Simplify polygon by removing vertices that are very close together.
-        This reduces file size and improves performance in Godot.
+        Simplify polygon outline with Ramer-Douglas-Peucker.
+        Drops vertices that deviate less than the tolerance from the
+        simplified outline, which keeps the shape while reducing file size
+        and improving performance in Godot.
+        
+        Polygon2D always closes the outline, so it is simplified as a ring:
+        the ring is started at the vertex farthest from the centroid (always
+        a true corner) so the start/end seam cannot erase a corner.
         
         Args:
-            coordinates: List of (x, y) coordinate tuples
-            tolerance: Minimum distance between points (in pixels)
+            coordinates: (N, 2) array of x, y coordinates
+            tolerance: Maximum allowed deviation from the outline (in pixels)
             
         Returns:
-            Simplified list of coordinates
+            Simplified (M, 2) array of coordinates
         """
         if len(coordinates) <= 3:
             return coordinates
         
-        simplified = [coordinates[0]]
+        # Drop an explicit closing vertex - the ring closes implicitly
+        if np.allclose(coordinates[0], coordinates[-1]):
+            coordinates = coordinates[:-1]
         
-        for i in range(1, len(coordinates)):
-            prev_x, prev_y = simplified[-1]
-            curr_x, curr_y = coordinates[i]
-            
-            # Calculate distance between points
-            distance = ((curr_x - prev_x) ** 2 + (curr_y - prev_y) ** 2) ** 0.5
-            
-            if distance >= tolerance:
-                simplified.append((curr_x, curr_y))
+        offsets = coordinates - coordinates.mean(axis=0)
+        start = int(np.argmax((offsets * offsets).sum(axis=1)))
+        
+        # Rotate to the corner and repeat it at the end to close the ring
+        ring = np.roll(coordinates, -start, axis=0)
+        ring = np.vstack([ring, ring[:1]])
+        keep = rdp_mask(ring, tolerance)[:-1]
         
-        return simplified
+        # Rotate back so vertices keep their original order
+        return coordinates[np.roll(keep, start)]
     
-    def calculate_centroid(self, coordinates: List[Tuple[float, float]]) -> Tuple[float, float]:
+    def calculate_centroid(self, coordinates: np.ndarray) -> np.ndarray:
         """
         Calculate the centroid (center point) of a polygon.
         Useful for positioning labels or determining territory centers.
         
         Args:
-            coordinates: List of (x, y) coordinate tuples
+            coordinates: (N, 2) array of x, y coordinates
+            
+        Returns:
+            Array of shape (2,) representing the centroid
+        """
+        if len(coordinates) == 0:
+            return np.zeros(2)
+        
+        return coordinates.mean(axis=0)
+    
+    def convert_svg_file(self, svg_file: Path,
+                         simplify: bool = True,
+                         tolerance: float = 1.0) -> Tuple[Optional[Dict], int]:
+        """
+        Convert a single SVG file to Godot format.
+        Runs in a worker process when called from convert_svg_folder.
+        
+        Args:
+            svg_file: Path to the SVG file
+            simplify: Whether to simplify the polygon
+            tolerance: Simplification tolerance (pixels)
             
         Returns:
-            (x, y) tuple representing the centroid
+            (territory data or None if no coordinates, original vertex count)
         """
-        if not coordinates:
-            return (0, 0)
+        # Get territory name from filename (remove .svg extension)
+        territory_name = svg_file.stem.replace('_', ' ').title()
         
-        x_sum = sum(x for x, y in coordinates)
-        y_sum = sum(y for x, y in coordinates)
-        count = len(coordinates)
+        # Parse SVG file
+        raw_coords = self.parse_svg_file(str(svg_file))
+        original_count = len(raw_coords)
         
-        return (x_sum / count, y_sum / count)
+        if original_count == 0:
+            return None, 0
+        
+        # Scale coordinates
+        scaled_coords = self.scale_coordinates(raw_coords)
+        
+        # Simplify if requested
+        if simplify:
+            scaled_coords = self.simplify_polygon(scaled_coords, tolerance)
+        
+        # Calculate centroid
+        centroid = self.calculate_centroid(scaled_coords)
+        
+        # Format for Godot (Vector2 arrays)
+        # Godot format: [[x1, y1], [x2, y2], ...]
+        polygon_points = np.round(scaled_coords, 2).tolist()
+        
+        territory = {
+            "name": territory_name,
+            "polygon": polygon_points,
+            "centroid": np.round(centroid, 2).tolist(),
+            "vertex_count": len(polygon_points)
+        }
+        return territory, original_count
     
     def convert_svg_folder(self, svg_folder: str, 
                            simplify: bool = True,
-                           tolerance: float = 1.0) -> Dict[str, Dict]:
+                           tolerance: float = 1.0,
+                           workers: Optional[int] = 1,
+                           cache_path: Optional[str] = None) -> Dict[str, Dict]:
         """
         Convert all SVG files in a folder to Godot format.
+        Files are independent and can be converted in parallel processes,
+        but each file is small, so converting in-process is the default.
+        Files unchanged since the last run are taken from the cache.
         
         Args:
             svg_folder: Path to folder containing SVG files
             simplify: Whether to simplify polygons
             tolerance: Simplification tolerance (pixels)
+            workers: Number of worker processes (1 = convert in this process,
+                     None = CPU count). A pool only pays off for large
+                     batches: on spawn platforms (Windows, macOS) every
+                     worker re-imports NumPy/numba at startup
+            cache_path: Optional sidecar JSON file caching converted territories
             
         Returns:
             Dictionary with territory data including polygon points and centroids
@@ -234,7 +517,7 @@ class SVGToGodotConverter:
             return {}
         
         # Find all SVG files
-        svg_files = list(svg_path.glob("*.svg"))
+        svg_files = sorted(svg_path.glob("*.svg"))
         
         if not svg_files:
             print(f"❌ ERROR: No SVG files found in {svg_folder}")
@@ -251,53 +534,113 @@ class SVGToGodotConverter:
         print()
         
         result = {}
+        self._total_vertices = 0
+        cache = self._load_cache(cache_path) if cache_path else {}
+        
+        # Reuse cached results for files whose stat and settings are unchanged
+        keys = {}
+        converted = {}
+        pending = []
+        for svg_file in svg_files:
+            stat = svg_file.stat()
+            keys[svg_file] = [_CACHE_VERSION, stat.st_mtime_ns, stat.st_size,
+                              simplify, tolerance, self.source_width, self.source_height,
+                              self.target_width, self.target_height]
+            entry = cache.get(str(svg_file))
+            # Malformed entries are treated as misses and overwritten
+            if (isinstance(entry, dict) and entry.get("key") == keys[svg_file]
+                    and isinstance(entry.get("territory"), dict)
+                    and isinstance(entry.get("original_count"), int)):
+                converted[svg_file] = (entry["territory"], entry["original_count"])
+            else:
+                pending.append(svg_file)
+        
+        convert = partial(self.convert_svg_file, simplify=simplify, tolerance=tolerance)
+        
+        if workers == 1 or len(pending) <= 1:
+            results = list(map(convert, pending))
+        else:
+            # Imported here so in-process and cache-hit runs skip multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(convert, pending, chunksize=4))
+        
+        for svg_file, (territory, original_count) in zip(pending, results):
+            converted[svg_file] = (territory, original_count)
+            if territory is not None:
+                cache[str(svg_file)] = {
+                    "key": keys[svg_file],
+                    "territory": territory,
+                    "original_count": original_count
+                }
         
-        for idx, svg_file in enumerate(sorted(svg_files), 1):
-            # Get territory name from filename (remove .svg extension)
-            territory_name = svg_file.stem.replace('_', ' ').title()
+        if cache_path:
+            # Keep only entries for SVGs converted in this run so the sidecar
+            # does not accumulate files that were removed or renamed
+            cache = {str(svg_file): cache[str(svg_file)] for svg_file in svg_files
+                     if str(svg_file) in cache}
+            self._save_cache(cache, cache_path)
+        
+        # Report progress here rather than in the workers so output stays ordered,
+        # buffering the lines into a single stdout write
+        progress_lines = []
+        for idx, svg_file in enumerate(svg_files, 1):
             territory_id = svg_file.stem  # Keep underscore version as ID
+            territory, original_count = converted[svg_file]
             
-            print(f"  [{idx}/{len(svg_files)}] Processing '{territory_id}'...", end=" ")
-            
-            # Parse SVG file
-            raw_coords = self.parse_svg_file(str(svg_file))
+            prefix = f"  [{idx}/{len(svg_files)}] Processing '{territory_id}'..."
             
-            if not raw_coords:
-                print("❌ FAILED (no coordinates)")
+            if territory is None:
+                progress_lines.append(f"{prefix} ❌ FAILED (no coordinates)")
                 continue
             
-            # Scale coordinates
-            scaled_coords = self.scale_coordinates(raw_coords)
-            
-            # Simplify if requested
-            if simplify:
-                original_count = len(scaled_coords)
-                scaled_coords = self.simplify_polygon(scaled_coords, tolerance)
-                simplified_count = len(scaled_coords)
-                reduction = ((original_count - simplified_count) / original_count * 100) if original_count > 0 else 0
-            
-            # Calculate centroid
-            centroid = self.calculate_centroid(scaled_coords)
-            
-            # Format for Godot (Vector2 arrays)
-            # Godot format: [[x1, y1], [x2, y2], ...]
-            polygon_points = [[round(x, 2), round(y, 2)] for x, y in scaled_coords]
-            
-            result[territory_id] = {
-                "name": territory_name,
-                "polygon": polygon_points,
-                "centroid": [round(centroid[0], 2), round(centroid[1], 2)],
-                "vertex_count": len(polygon_points)
-            }
+            result[territory_id] = territory
+            self._total_vertices += territory["vertex_count"]
             
             if simplify:
-                print(f"✅ {original_count} → {simplified_count} vertices (-{reduction:.1f}%)")
+                simplified_count = territory["vertex_count"]
+                reduction = (original_count - simplified_count) / original_count * 100
+                progress_lines.append(f"{prefix} ✅ {original_count} → {simplified_count} vertices (-{reduction:.1f}%)")
             else:
-                print(f"✅ {len(polygon_points)} vertices")
+                progress_lines.append(f"{prefix} ✅ {territory['vertex_count']} vertices")
         
+        sys.stdout.write("\n".join(progress_lines) + "\n")
+        
+        cached_count = len(svg_files) - len(pending)
+        if cached_count:
+            print(f"\n♻️  {cached_count} unchanged territories loaded from cache")
         print(f"\n✅ Conversion complete! {len(result)} territories converted.")
         return result
     
+    def _load_cache(self, cache_path: str) -> Dict[str, Dict]:
+        """Load the conversion cache, starting fresh if missing or unreadable."""
+        try:
+            with open(cache_path, 'rb') as f:
+                raw = f.read()
+            cache = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Warning: Ignoring unreadable cache {cache_path}: {e}")
+            return {}
+        
+        if not isinstance(cache, dict):
+            print(f"⚠️  Warning: Ignoring malformed cache {cache_path}")
+            return {}
+        return cache
+    
+    def _save_cache(self, cache: Dict[str, Dict], cache_path: str):
+        """Write the conversion cache; a failure only costs the next run time."""
+        try:
+            if orjson is not None:
+                payload = orjson.dumps(cache)
+            else:
+                payload = json.dumps(cache).encode('utf-8')
+            with open(cache_path, 'wb') as f:
+                f.write(payload)
+        except OSError as e:
+            print(f"⚠️  Warning: Failed to write cache {cache_path}: {e}")
+    
     def save_to_json(self, data: Dict, output_path: str):
         """
         Save converted territory data to JSON file.
@@ -309,16 +652,20 @@ class SVGToGodotConverter:
         print(f"\n💾 Saving to: {output_path}")
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            else:
+                payload = json.dumps(data, indent=2).encode('utf-8')
+            
+            with open(output_path, 'wb') as f:
+                f.write(payload)
             
-            # Calculate file size
-            file_size = Path(output_path).stat().st_size
-            size_kb = file_size / 1024
+            # File size is the encoded payload length - no need to stat
+            size_kb = len(payload) / 1024
             
             print(f"✅ Successfully saved! File size: {size_kb:.2f} KB")
             print(f"   Total territories: {len(data)}")
-            print(f"   Total vertices: {sum(t['vertex_count'] for t in data.values())}")
+            print(f"   Total vertices: {self._total_vertices}")
             
         except Exception as e:
             print(f"❌ ERROR: Failed to save file: {e}")
@@ -385,7 +732,8 @@ def main():
     godot_data = converter.convert_svg_folder(
         input_folder,
         simplify=True,
-        tolerance=1.0  # Adjust this value: higher = more simplification
+        tolerance=1.0,  # Adjust this value: higher = more simplification
+        cache_path=str(output_path.with_suffix('.cache.json'))
     )
     
     if not godot_data:
@@ -5,90 +5,137 @@ Checks that all required files and data are present.
 """
 
 import json
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Tuple
 
-def check_integration():
-    """Verify all components are ready for Godot integration."""
+try:
+    # ijson is optional - it streams the JSON instead of loading every vertex
+    import ijson
+except ImportError:
+    ijson = None
+
+SAMPLE_TERRITORIES = ['alaska', 'quebec', 'great_britain', 'argentina']
+
+# Each check returns one (passed, message) pair per numbered result line
+CheckResult = List[Tuple[bool, str]]
+
+
+def _read_territory_summary(json_path: Path) -> Tuple[int, Dict[str, Dict]]:
+    """Count top-level territories and collect only the sampled ones."""
+    if ijson is None:
+        with open(json_path, 'r') as f:
+            data = json.load(f)
+        return len(data), {k: data[k] for k in SAMPLE_TERRITORIES if k in data}
     
-    print("🔍 Validating Polygon Integration Setup...")
-    print("=" * 60)
+    count = 0
+    samples = {}
+    with open(json_path, 'rb') as f:
+        for key, value in ijson.kvitems(f, '', use_float=True):
+            count += 1
+            if key in SAMPLE_TERRITORIES:
+                samples[key] = value
+    return count, samples
+
+
+def _contains_all(path: Path, needles: List[bytes]) -> bool:
+    """Check a file contains every needle without reading or decoding it whole."""
+    with open(path, 'rb') as f:
+        # mmap cannot map an empty file - it trivially contains nothing
+        if f.seek(0, 2) == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return all(mm.find(needle) != -1 for needle in needles)
+
+
+def _check_json() -> CheckResult:
+    """Checks 1-2: polygon JSON exists and contains all territories."""
+    json_path = Path("MVP_GODOT/data/territory_polygons.json")
+    if not json_path.exists():
+        return [
+            (False, f"❌ 1. JSON file missing: {json_path}\n"
+                    "   Run: python MVP_GODOT/tools/svg_to_godot_polygons.py"),
+            (False, "⏭️  2. Skipping JSON validation"),
+        ]
     
-    checks_passed = 0
-    checks_total = 0
+    results = [(True, f"✅ 1. JSON file exists: {json_path}")]
     
-    # Check 1: JSON file exists
-    checks_total += 1
-    json_path = Path("MVP_GODOT/data/territory_polygons.json")
-    if json_path.exists():
-        print("✅ 1. JSON file exists:", json_path)
-        checks_passed += 1
+    # Check JSON is valid and has all territories
+    json_errors = (json.JSONDecodeError,) if ijson is None else (ijson.JSONError,)
+    try:
+        count, samples = _read_territory_summary(json_path)
         
-        # Check JSON is valid and has all territories
-        checks_total += 1
-        try:
-            with open(json_path, 'r') as f:
-                data = json.load(f)
+        if count == 42:
+            lines = ["✅ 2. JSON contains all 42 territories"]
             
-            if len(data) == 42:
-                print(f"✅ 2. JSON contains all 42 territories")
-                checks_passed += 1
-                
-                # Sample a few territories
-                sample_territories = ['alaska', 'quebec', 'great_britain', 'argentina']
-                print("\n   📊 Sample Territory Data:")
-                for terr in sample_territories:
-                    if terr in data:
-                        d = data[terr]
-                        print(f"      • {terr}: {d['vertex_count']} vertices at [{d['centroid'][0]:.1f}, {d['centroid'][1]:.1f}]")
-                
-            else:
-                print(f"❌ 2. JSON has {len(data)} territories (expected 42)")
-        except json.JSONDecodeError as e:
-            print(f"❌ 2. JSON parse error: {e}")
-    else:
-        print("❌ 1. JSON file missing:", json_path)
-        print("   Run: python MVP_GODOT/tools/svg_to_godot_polygons.py")
-        checks_total += 1
-        print("⏭️  2. Skipping JSON validation")
+            # Sample a few territories
+            lines.append("\n   📊 Sample Territory Data:")
+            for terr in SAMPLE_TERRITORIES:
+                if terr in samples:
+                    d = samples[terr]
+                    lines.append(f"      • {terr}: {d['vertex_count']} vertices at [{d['centroid'][0]:.1f}, {d['centroid'][1]:.1f}]")
+            results.append((True, "\n".join(lines)))
+        else:
+            results.append((False, f"❌ 2. JSON has {count} territories (expected 42)"))
+    except json_errors as e:
+        results.append((False, f"❌ 2. JSON parse error: {e}"))
     
-    # Check 3: Territory.tscn updated
-    checks_total += 1
+    return results
+
+
+def _check_tscn() -> CheckResult:
+    """Check 3: Territory.tscn updated."""
     tscn_path = Path("MVP_GODOT/scenes/Territory.tscn")
-    if tscn_path.exists():
-        content = tscn_path.read_text()
-        if 'Polygon2D' in content and 'CollisionPolygon2D' in content:
-            print("✅ 3. Territory.tscn uses Polygon2D")
-            checks_passed += 1
-        else:
-            print("❌ 3. Territory.tscn still uses ColorRect (not updated)")
-    else:
-        print("❌ 3. Territory.tscn not found")
+    if not tscn_path.exists():
+        return [(False, "❌ 3. Territory.tscn not found")]
     
-    # Check 4: Territory.gd updated
-    checks_total += 1
+    if _contains_all(tscn_path, [b'Polygon2D', b'CollisionPolygon2D']):
+        return [(True, "✅ 3. Territory.tscn uses Polygon2D")]
+    return [(False, "❌ 3. Territory.tscn still uses ColorRect (not updated)")]
+
+
+def _check_territory_gd() -> CheckResult:
+    """Check 4: Territory.gd updated."""
     gd_path = Path("MVP_GODOT/scripts/Territory.gd")
-    if gd_path.exists():
-        content = gd_path.read_text()
-        if 'set_polygon_data' in content and 'territory_shape' in content:
-            print("✅ 4. Territory.gd has polygon methods")
-            checks_passed += 1
-        else:
-            print("❌ 4. Territory.gd missing set_polygon_data() method")
-    else:
-        print("❌ 4. Territory.gd not found")
+    if not gd_path.exists():
+        return [(False, "❌ 4. Territory.gd not found")]
     
-    # Check 5: Main.gd updated
-    checks_total += 1
+    if _contains_all(gd_path, [b'set_polygon_data', b'territory_shape']):
+        return [(True, "✅ 4. Territory.gd has polygon methods")]
+    return [(False, "❌ 4. Territory.gd missing set_polygon_data() method")]
+
+
+def _check_main_gd() -> CheckResult:
+    """Check 5: Main.gd updated."""
     main_path = Path("MVP_GODOT/scripts/Main.gd")
-    if main_path.exists():
-        content = main_path.read_text(encoding='utf-8')
-        if 'load_territory_polygons' in content and 'territory_polygon_data' in content:
-            print("✅ 5. Main.gd loads polygon data")
+    if not main_path.exists():
+        return [(False, "❌ 5. Main.gd not found")]
+    
+    if _contains_all(main_path, [b'load_territory_polygons', b'territory_polygon_data']):
+        return [(True, "✅ 5. Main.gd loads polygon data")]
+    return [(False, "❌ 5. Main.gd missing load_territory_polygons() method")]
+
+
+def check_integration():
+    """Verify all components are ready for Godot integration."""
+    
+    print("🔍 Validating Polygon Integration Setup...")
+    print("=" * 60)
+    
+    # The checks touch independent files, so run them concurrently and
+    # overlap the filesystem latency; results are printed in order below
+    checks = [_check_json, _check_tscn, _check_territory_gd, _check_main_gd]
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        results = [r for check_results in executor.map(lambda check: check(), checks)
+                   for r in check_results]
+    
+    checks_passed = 0
+    checks_total = len(results)
+    for passed, message in results:
+        print(message)
+        if passed:
             checks_passed += 1
-        else:
-            print("❌ 5. Main.gd missing load_territory_polygons() method")
-    else:
-        print("❌ 5. Main.gd not found")
     
     # Summary
     print("\n" + "=" * 60)